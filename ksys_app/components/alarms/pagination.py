@@ -9,6 +9,8 @@ Pagination Component for Alarm Dashboard
 
 작성일: 2025-10-02
 수정일: 2025-10-23 - Added computed variable support
+수정일: 2026-10-14 - 항목 정보 문자열은 State의 page_display computed var로 전달
+수정일: 2026-10-14 - has_prev_page/has_next_page 필수, 인라인 계산 fallback 제거
 참고: docs/alarm/alarm-components.md
 """
 
@@ -18,51 +20,36 @@ import reflex as rx
 def pagination(
     current_page: int | rx.Var,
     total_pages: int | rx.Var,
-    total_items: int | rx.Var,
-    page_size: int | rx.Var,
+    page_display: str | rx.Var,
+    has_prev_page: rx.Var[bool],
+    has_next_page: rx.Var[bool],
     on_prev: rx.EventHandler,
     on_next: rx.EventHandler,
     on_page_change: rx.EventHandler | None = None,
-    page_info: str | rx.Var | None = None,  # NEW: Optional page_info computed var
-    has_prev_page: bool | rx.Var | None = None,  # NEW: Optional has_prev_page
-    has_next_page: bool | rx.Var | None = None,  # NEW: Optional has_next_page
 ) -> rx.Component:
     """
     페이지네이션 컴포넌트
 
+    표시/활성화 값은 모두 State의 computed var로 받는다 (컴포넌트에서 계산하지 않음).
+
     Args:
-        current_page: 현재 페이지 (1-indexed)
-        total_pages: 총 페이지 수
-        total_items: 총 아이템 수
-        page_size: 페이지당 아이템 수
+        current_page: 현재 페이지 (1-indexed, "{current_page} / {total_pages}" 표시용)
+        total_pages: 총 페이지 수 (표시용)
+        page_display: Computed 항목 정보 문자열 (예: "Showing 1-20 of 144")
+        has_prev_page: Computed has_prev_page var (rx.Var[bool] - `~` on a plain bool is always truthy)
+        has_next_page: Computed has_next_page boolean
         on_prev: 이전 페이지 핸들러
         on_next: 다음 페이지 핸들러
         on_page_change: 특정 페이지로 이동 핸들러
-        page_info: (선택) Computed page_info string (예: "1-20 / 144")
-        has_prev_page: (선택) Computed has_prev_page boolean
-        has_next_page: (선택) Computed has_next_page boolean
 
     Returns:
         rx.Component: Pagination 컴포넌트
 
     Examples:
-        >>> # Legacy usage (backward compatible)
-        >>> pagination(
-        ...     current_page=AlarmsState.page,
-        ...     total_pages=AlarmsState.total_pages,
-        ...     total_items=AlarmsState.filtered_count,
-        ...     page_size=AlarmsState.page_size,
-        ...     on_prev=AlarmsState.prev_page,
-        ...     on_next=AlarmsState.next_page,
-        ... )
-        >>>
-        >>> # New usage (with computed variables)
         >>> pagination(
         ...     current_page=AlarmsState.page,
         ...     total_pages=AlarmsState.total_pages,
-        ...     total_items=AlarmsState.filtered_count,
-        ...     page_size=AlarmsState.page_size,
-        ...     page_info=AlarmsState.page_info,
+        ...     page_display=AlarmsState.page_display,
         ...     has_prev_page=AlarmsState.has_prev_page,
         ...     has_next_page=AlarmsState.has_next_page,
         ...     on_prev=AlarmsState.prev_page,
@@ -70,28 +57,10 @@ def pagination(
         ... )
     """
 
-    # Use provided page_info or compute it (backward compatibility)
-    if page_info is not None:
-        display_info = f"Showing {page_info}"
-    else:
-        display_info = f"Showing {(current_page - 1) * page_size + 1}-{rx.cond(current_page * page_size > total_items, total_items, current_page * page_size)} of {total_items}"
-
-    # Use provided has_prev_page or compute it (backward compatibility)
-    if has_prev_page is not None:
-        prev_disabled = ~has_prev_page  # Reflex boolean negation
-    else:
-        prev_disabled = current_page == 1
-
-    # Use provided has_next_page or compute it (backward compatibility)
-    if has_next_page is not None:
-        next_disabled = ~has_next_page  # Reflex boolean negation
-    else:
-        next_disabled = current_page >= total_pages
-
     return rx.hstack(
         # 왼쪽: 항목 정보
         rx.text(
-            display_info,
+            page_display,
             size="2",
             color="gray",
         ),
@@ -105,7 +74,7 @@ def pagination(
                 rx.icon("chevron-left"),
                 size="1",
                 variant="soft",
-                disabled=prev_disabled,
+                disabled=~has_prev_page,  # Reflex boolean negation
                 on_click=on_prev,
             ),
 
@@ -121,7 +90,7 @@ def pagination(
                 rx.icon("chevron-right"),
                 size="1",
                 variant="soft",
-                disabled=next_disabled,
+                disabled=~has_next_page,  # Reflex boolean negation
                 on_click=on_next,
             ),
 
@@ -2,117 +2,216 @@ from __future__ import annotations
 
 import os
 import sys
+import time
 import asyncio
 import logging
 import asyncpg
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 from ksys_app.utils.logger import get_logger, log_function
 
 # Initialize logger for this module
 logger = get_logger(__name__)
 
-# Windows에서 ProactorEventLoop 문제 해결 (로컬 개발 환경에서만)
-# Docker 환경에서는 Linux이므로 이 설정이 필요 없음
-if sys.platform == 'win32' and not os.environ.get('DOCKER_CONTAINER'):
-    logger.info("Setting WindowsSelectorEventLoopPolicy for Windows environment")
-    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-else:
-    logger.info(f"Running on platform: {sys.platform}, Docker: {os.environ.get('DOCKER_CONTAINER', 'False')}")
+
+def _init_loop_policy() -> None:
+    """Windows에서 ProactorEventLoop 문제 해결 (로컬 개발 환경에서만)
+
+    Docker 환경에서는 Linux이므로 이 설정이 필요 없음.
+    모듈이 다시 import/reload 되어도 이미 설정된 정책은 다시 설치하지 않음
+    (정책 재설치 시 기존 이벤트 루프가 교체되는 문제 방지).
+    """
+    if sys.platform == 'win32' and not os.environ.get('DOCKER_CONTAINER'):
+        if isinstance(asyncio.get_event_loop_policy(), asyncio.WindowsSelectorEventLoopPolicy):
+            return
+        logger.info("Setting WindowsSelectorEventLoopPolicy for Windows environment")
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    else:
+        logger.info(f"Running on platform: {sys.platform}, Docker: {os.environ.get('DOCKER_CONTAINER', 'False')}")
+
+
+_init_loop_policy()
+
+# 슬로우 쿼리 경고 기준 (초) - SLOW_QUERY_THRESHOLD 환경변수로 조정
+SLOW_QUERY_THRESHOLD = float(os.environ.get("SLOW_QUERY_THRESHOLD", "2.0"))
+
+# 풀 크기 설정 - min_size 만큼은 풀 생성 시 미리 연결 (pre-warm)
+POOL_MIN_SIZE = int(os.environ.get("DB_POOL_MIN_SIZE", "5"))
+POOL_MAX_SIZE = int(os.environ.get("DB_POOL_MAX_SIZE", "25"))
+POOL_MAX_INACTIVE_LIFETIME = float(os.environ.get("DB_POOL_MAX_INACTIVE_LIFETIME", "300"))  # 유휴 연결 회수 (초)
+POOL_MAX_QUERIES = int(os.environ.get("DB_POOL_MAX_QUERIES", "50000"))  # 연결당 최대 쿼리 수 후 재연결
+
+POOL_ACQUIRE_TIMEOUT = float(os.environ.get("DB_POOL_ACQUIRE_TIMEOUT", "10"))  # 풀 연결 대기 최대 시간 (초)
+
+# Prepared statement 캐시 (연결별 LRU, 0 = 수명 제한 없음)
+STATEMENT_CACHE_SIZE = int(os.environ.get("DB_STATEMENT_CACHE_SIZE", "1024"))
+MAX_CACHED_STATEMENT_LIFETIME = int(os.environ.get("DB_MAX_CACHED_STATEMENT_LIFETIME", "0"))
+
+
+# 환경변수는 프로세스 실행 중 바뀌지 않으므로 최초 1회만 읽음
+_DSN_CACHE: str | None = None
 
 
-@log_function
 def _dsn() -> str:
-    dsn = os.environ.get("TS_DSN", "")
-    if not dsn:
-        logger.error("TS_DSN is not set in environment")
-        raise RuntimeError("TS_DSN is not set in environment")
-    logger.debug(f"DSN retrieved: {dsn[:30]}...")  # Log only first 30 chars for security
-    return dsn
+    global _DSN_CACHE
+
+    if _DSN_CACHE is None:
+        dsn = os.environ.get("TS_DSN", "")
+        if not dsn:
+            logger.error("TS_DSN is not set in environment")
+            raise RuntimeError("TS_DSN is not set in environment")
+        logger.debug(f"DSN retrieved: {dsn[:30]}...")  # Log only first 30 chars for security
+        _DSN_CACHE = dsn
+    return _DSN_CACHE
+
+
+class PoolTimeoutError(asyncio.TimeoutError):
+    """풀에서 연결을 제때 얻지 못함 (풀 포화)
+
+    asyncio.TimeoutError 하위 클래스이므로 기존 타임아웃 처리 코드에서도 잡힌다.
+    """
 
 
 # 글로벌 풀 변수
 _GLOBAL_POOL: asyncpg.Pool | None = None
-_POOL_LOCK = asyncio.Lock()
+_POOL_LOCK = asyncio.Lock()  # 풀 생성 시에만 사용 (생성 이후 경로에서는 잡지 않음)
 
 
-@log_function
 async def get_pool() -> asyncpg.Pool:
-    """글로벌 싱글톤 풀 관리"""
+    """글로벌 싱글톤 풀 관리 (초기화 이후에는 lock/로깅 없이 바로 반환)"""
+    pool = _GLOBAL_POOL
+    if pool is not None:
+        return pool
+    return await _create_pool_locked()
+
+
+@log_function
+async def _create_pool_locked() -> asyncpg.Pool:
+    """최초 접근 시에만 lock을 잡고 풀 생성"""
     global _GLOBAL_POOL
 
-    if _GLOBAL_POOL is None:
-        async with _POOL_LOCK:
-            # 다시 확인 (double-check)
-            if _GLOBAL_POOL is None:
-                pid = os.getpid()
-                logger.info(f"Creating global pool for first access in process {pid}")
-                try:
-                    _GLOBAL_POOL = await asyncpg.create_pool(
-                        _dsn(),
-                        min_size=1,  # 최소 연결 수
-                        max_size=10,  # 최대 연결 수
-                        timeout=30.0,  # 연결 대기 시간
-                        command_timeout=30.0,  # 명령 타임아웃
-                    )
-                    logger.info(f"Global pool created successfully (PID: {pid})")
-                except Exception as e:
-                    logger.error(f"Failed to create global pool: {str(e)}")
-                    _GLOBAL_POOL = None
-                    raise
+    async with _POOL_LOCK:
+        # 다시 확인 (double-check)
+        if _GLOBAL_POOL is None:
+            pid = os.getpid()
+            logger.info(
+                f"Creating global pool for first access in process {pid} "
+                f"(min={POOL_MIN_SIZE}, max={POOL_MAX_SIZE})"
+            )
+            try:
+                _GLOBAL_POOL = await asyncpg.create_pool(
+                    _dsn(),
+                    min_size=POOL_MIN_SIZE,  # 최소 연결 수 (생성 시 미리 연결)
+                    max_size=POOL_MAX_SIZE,  # 최대 연결 수
+                    max_inactive_connection_lifetime=POOL_MAX_INACTIVE_LIFETIME,
+                    max_queries=POOL_MAX_QUERIES,
+                    timeout=30.0,  # 연결 대기 시간
+                    command_timeout=30.0,  # 명령 타임아웃
+                    statement_cache_size=STATEMENT_CACHE_SIZE,  # SQL별 prepared statement 재사용
+                    max_cached_statement_lifetime=MAX_CACHED_STATEMENT_LIFETIME,
+                )
+                logger.info(f"Global pool created successfully (PID: {pid})")
+            except Exception as e:
+                logger.error(f"Failed to create global pool: {str(e)}")
+                _GLOBAL_POOL = None
+                raise
 
     return _GLOBAL_POOL
 
 
-@log_function
-async def q(sql: str, params: tuple | dict = (), timeout: float = 30.0):
-    """쿼리 실행 - 글로벌 풀 사용"""
-    start_time = asyncio.get_event_loop().time()
+@asynccontextmanager
+async def acquire(timeout: float | None = None) -> AsyncIterator[asyncpg.Connection]:
+    """글로벌 풀에서 연결 획득 - 대기 시간 초과 시 PoolTimeoutError
 
+    풀을 우회하는 직접 연결은 만들지 않는다 (DB max_connections 초과 방지).
+    """
+    # get_pool() fast path inlined - steady state is one global read, no extra coroutine
+    pool = _GLOBAL_POOL
+    if pool is None:
+        pool = await _create_pool_locked()
+    wait = POOL_ACQUIRE_TIMEOUT if timeout is None else timeout
     try:
-        pool = await get_pool()
+        conn = await pool.acquire(timeout=wait)
+    except asyncio.TimeoutError as e:
+        raise PoolTimeoutError(f"Timed out after {wait:.1f}s waiting for a pooled connection") from e
+    try:
+        yield conn
+    finally:
+        await pool.release(conn)
+
+
+def records_to_dicts(rows) -> list[dict[str, Any]]:
+    """asyncpg.Record 리스트를 dict 리스트로 변환 (State/JSON 직렬화 경계에서 사용)"""
+    return [dict(row) for row in rows]
+
+
+async def q(sql: str, params: tuple | dict = (), timeout: float = 30.0, as_dict: bool = True):
+    """쿼리 실행 - 글로벌 풀 사용
+
+    as_dict=False 이면 asyncpg.Record 리스트를 그대로 반환한다.
+    Record는 row['col'] 접근을 지원하므로, 결과를 바로 순회하며 가공하는
+    호출부에서는 행마다 dict를 만들 필요가 없다.
+    """
+    start_time = time.perf_counter()
 
+    try:
         # asyncpg는 named parameters ($1, $2)만 지원하므로 변환
         if isinstance(params, dict):
             # Convert named parameters to positional
             # For now, use positional parameters only
             params = tuple(params.values()) if params else ()
-        
+
         # 풀에서 연결 가져오기 및 쿼리 실행
-        async with pool.acquire() as conn:
-            # asyncpg는 fetch() 메서드로 결과를 dict 형태로 반환
+        async with acquire() as conn:
             results = await conn.fetch(sql, *params, timeout=timeout)
 
-            # Convert asyncpg.Record to dict
-            results = [dict(row) for row in results]
+            # Convert asyncpg.Record to dict (State에 그대로 넣는 호출부용)
+            if as_dict:
+                results = records_to_dicts(results)
 
-            # Log only if query took > 1 second
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > 1.0:
+            # Log only if query took longer than SLOW_QUERY_THRESHOLD
+            elapsed = time.perf_counter() - start_time
+            if elapsed > SLOW_QUERY_THRESHOLD:
                 logger.warning(f"Slow query ({elapsed:.2f}s): {sql[:100]}...")
             elif logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"Query completed in {elapsed:.3f}s, returned {len(results)} rows")
 
             return results
 
-    except asyncio.TimeoutError as e:
-        # 타임아웃 시 직접 연결 사용
-        logger.warning(f"Pool timeout, using direct connection: {str(e)}")
+    except PoolTimeoutError as e:
+        logger.warning(f"Pool exhausted: {str(e)} - SQL: {sql[:100]}...")
+        raise
 
-        try:
-            conn = await asyncpg.connect(_dsn())
-            try:
-                results = await conn.fetch(sql, *params, timeout=timeout)
-                results = [dict(row) for row in results]
+    except Exception as e:
+        logger.error(f"Query execution failed: {str(e)}")
+        logger.error(f"SQL: {sql}")
+        logger.error(f"Params: {params}")
+        raise
+
+
+async def q_one(sql: str, params: tuple | dict = (), timeout: float = 30.0) -> dict[str, Any] | None:
+    """단일 행 조회 (fetchrow) - 결과가 없으면 None"""
+    start_time = time.perf_counter()
+
+    try:
+        if isinstance(params, dict):
+            params = tuple(params.values()) if params else ()
+
+        async with acquire() as conn:
+            rec = await conn.fetchrow(sql, *params, timeout=timeout)
 
-                elapsed = asyncio.get_event_loop().time() - start_time
-                logger.info(f"Direct connection query completed in {elapsed:.3f}s")
-                return results
-            finally:
-                await conn.close()
+            # Log only if query took longer than SLOW_QUERY_THRESHOLD
+            elapsed = time.perf_counter() - start_time
+            if elapsed > SLOW_QUERY_THRESHOLD:
+                logger.warning(f"Slow query ({elapsed:.2f}s): {sql[:100]}...")
+            elif logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Query completed in {elapsed:.3f}s, returned {0 if rec is None else 1} row")
 
-        except Exception as e2:
-            logger.error(f"Direct connection also failed: {str(e2)}")
-            raise
+            return dict(rec) if rec is not None else None
+
+    except PoolTimeoutError as e:
+        logger.warning(f"Pool exhausted: {str(e)} - SQL: {sql[:100]}...")
+        raise
 
     except Exception as e:
         logger.error(f"Query execution failed: {str(e)}")
@@ -121,46 +220,67 @@ async def q(sql: str, params: tuple | dict = (), timeout: float = 30.0):
         raise
 
 
-@log_function
+async def q_stream(sql: str, params: tuple | dict = (), prefetch: int = 1000, timeout: float = 30.0):
+    """서버 사이드 커서로 결과를 스트리밍 (prefetch 단위로 가져옴)
+
+    전체 결과를 메모리에 올리지 않으므로 대용량 조회에 사용한다.
+    asyncpg 커서는 트랜잭션 안에서만 동작한다 (BEGIN/DECLARE/COMMIT 왕복 추가) -
+    결과를 어차피 리스트로 모으는 작은 조회는 q()를 사용할 것.
+    """
+    start_time = time.perf_counter()
+    row_count = 0
+
+    try:
+        if isinstance(params, dict):
+            params = tuple(params.values()) if params else ()
+
+        async with acquire() as conn:
+            async with conn.transaction():
+                async for rec in conn.cursor(sql, *params, prefetch=prefetch, timeout=timeout):
+                    row_count += 1
+                    yield rec
+
+        # Elapsed includes the consumer's per-row work between fetches
+        elapsed = time.perf_counter() - start_time
+        if elapsed > SLOW_QUERY_THRESHOLD:
+            logger.warning(f"Slow stream ({elapsed:.2f}s, {row_count} rows): {sql[:100]}...")
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Stream completed in {elapsed:.3f}s, returned {row_count} rows")
+
+    except PoolTimeoutError as e:
+        logger.warning(f"Pool exhausted: {str(e)} - SQL: {sql[:100]}...")
+        raise
+
+    except Exception as e:
+        logger.error(f"Stream query failed after {row_count} rows: {str(e)}")
+        logger.error(f"SQL: {sql}")
+        logger.error(f"Params: {params}")
+        raise
+
+
 async def execute_query(sql: str, params: tuple | dict = (), timeout: float = 30.0):
     """Execute SQL without expecting results (for INSERT, UPDATE, DELETE)"""
-    start_time = asyncio.get_event_loop().time()
+    start_time = time.perf_counter()
 
     try:
-        pool = await get_pool()
-
         # asyncpg는 named parameters ($1, $2)만 지원하므로 변환
         if isinstance(params, dict):
             params = tuple(params.values()) if params else ()
 
         # 풀에서 연결 가져오기 및 쿼리 실행
-        async with pool.acquire() as conn:
+        async with acquire() as conn:
             await conn.execute(sql, *params, timeout=timeout)
 
-            # Log only if query took > 1 second
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > 1.0:
+            # Log only if query took longer than SLOW_QUERY_THRESHOLD
+            elapsed = time.perf_counter() - start_time
+            if elapsed > SLOW_QUERY_THRESHOLD:
                 logger.warning(f"Slow execute ({elapsed:.2f}s): {sql[:100]}...")
             elif logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"Execute completed in {elapsed:.3f}s")
 
-    except asyncio.TimeoutError as e:
-        # 타임아웃 시 직접 연결 사용
-        logger.warning(f"Pool timeout, using direct connection for execute: {str(e)}")
-
-        try:
-            conn = await asyncpg.connect(_dsn())
-            try:
-                await conn.execute(sql, *params, timeout=timeout)
-
-                elapsed = asyncio.get_event_loop().time() - start_time
-                logger.info(f"Direct connection execute completed in {elapsed:.3f}s")
-            finally:
-                await conn.close()
-
-        except Exception as e2:
-            logger.error(f"Direct connection execute also failed: {str(e2)}")
-            raise
+    except PoolTimeoutError as e:
+        logger.warning(f"Pool exhausted: {str(e)} - SQL: {sql[:100]}...")
+        raise
 
     except Exception as e:
         logger.error(f"Execute query failed: {str(e)}")
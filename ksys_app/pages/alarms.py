@@ -215,9 +215,7 @@ def history_alarms_view() -> rx.Component:
             pagination(
                 current_page=AlarmsState.page,
                 total_pages=AlarmsState.total_pages,
-                total_items=AlarmsState.total_count,  # Use total_count directly (server-side value)
-                page_size=AlarmsState.page_size,
-                # page_info=AlarmsState.page_info,  # Don't pass - let pagination compute it from total_items
+                page_display=AlarmsState.page_display,
                 has_prev_page=AlarmsState.has_prev_page,
                 has_next_page=AlarmsState.has_next_page,
                 on_prev=AlarmsState.prev_page,
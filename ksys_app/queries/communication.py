@@ -149,7 +149,7 @@ async def get_available_tags() -> List[str]:
     """
     
     try:
-        result = await q(query, ())
+        result = await q(query, (), as_dict=False)
         return [row['tag_name'] for row in result]
     except Exception as e:
         print(f"Error fetching tags: {e}")
@@ -208,7 +208,7 @@ async def communication_heatmap_data(
     """
     
     try:
-        result = await q(query, (start_date, end_date, tag_name, start_date, end_date))
+        result = await q(query, (start_date, end_date, tag_name, start_date, end_date), as_dict=False)
         
         # Transform data for heatmap format
         heatmap_data = {}
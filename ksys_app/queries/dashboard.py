@@ -67,9 +67,9 @@ async def get_dashboard_data(tag_names: Optional[List[str]] = None) -> List[Dict
 
     # 쿼리 실행
     if params:
-        rows = await q(dashboard_sql, tuple(params))
+        rows = await q(dashboard_sql, tuple(params), as_dict=False)
     else:
-        rows = await q(dashboard_sql, ())
+        rows = await q(dashboard_sql, (), as_dict=False)
 
     # 결과 변환
     results = []
@@ -150,7 +150,7 @@ async def get_dashboard_stats() -> Dict[str, Any]:
     FROM dashboard_view
     """
 
-    result = await q(stats_sql, ())
+    result = await q(stats_sql, (), as_dict=False)
     if result:
         row = result[0]
         return {
@@ -48,7 +48,7 @@ async def realtime_data(
         window_str = f"{window_seconds} seconds"
         max_points = window_seconds // interval_seconds
         
-        results = await q(realtime_sql, (interval_str, tag_name, window_str, max_points))
+        results = await q(realtime_sql, (interval_str, tag_name, window_str, max_points), as_dict=False)
         
         # 결과를 시간 순으로 정렬하고 포맷팅
         formatted_results = []
@@ -97,7 +97,7 @@ async def get_all_tags_latest_realtime() -> List[Dict[str, Any]]:
             ORDER BY tag_name
         """
 
-        results = await q(realtime_sql, ())
+        results = await q(realtime_sql, (), as_dict=False)
 
         # 결과를 포맷팅
         formatted_results = []
@@ -141,7 +141,7 @@ async def get_all_tags_latest_hist() -> List[Dict[str, Any]]:
             LIMIT 50
         """
 
-        results = await q(realtime_sql, ())
+        results = await q(realtime_sql, (), as_dict=False)
 
         # 결과를 포맷팅
         formatted_results = []
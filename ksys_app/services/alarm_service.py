@@ -29,10 +29,16 @@ class AlarmService:
         severity_filter: Optional[str] = None,
         status_filter: Optional[str] = None,
         search_query: Optional[str] = None,
+        after: Optional[Dict[str, Any]] = None,
+        total: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Get RULE_BASE alarms from recent hours (with pagination)
 
+        With ``after`` (the previous page's ``next_cursor``) the page is read
+        by keyset (``(triggered_at, event_id) < cursor``) instead of OFFSET,
+        so deep pages do not scan and discard all preceding rows.
+
         Args:
             hours: Look back hours (default 24)
             limit: Max results for backward compatibility (default 100)
@@ -42,6 +48,8 @@ class AlarmService:
             severity_filter: Filter by severity (CRITICAL, WARNING, INFO)
             status_filter: Filter by status (UNACKNOWLEDGED, ACKNOWLEDGED)
             search_query: Search query for tag_name, message, or cause
+            after: Keyset cursor {triggered_at, event_id} of the previous page's last row
+            total: Known total count for the same filters (skips COUNT query)
 
         Returns:
             Dict with:
@@ -50,6 +58,7 @@ class AlarmService:
                 - page: Current page
                 - page_size: Items per page
                 - total_pages: Total pages
+                - next_cursor: Keyset cursor for the following page (None if last)
         """
         try:
             await self.session.execute(text("SET LOCAL statement_timeout = '10s'"))
@@ -94,24 +103,35 @@ class AlarmService:
 
             where_sql = " AND ".join(where_clauses)
 
-            # Count total first
-            count_q = text(f"""
-                SELECT COUNT(*) as total
-                FROM alarm_history
-                WHERE {where_sql}
-            """)
-
             query_params = {"hours": hours}
             if search_query:
                 query_params["search_pattern"] = f"%{search_query}%"
 
-            count_result = await self.session.execute(count_q, query_params)
-            total = count_result.scalar() or 0
+            # Count total first (caller may pass a known total while paging the same filters)
+            if total is None:
+                count_q = text(f"""
+                    SELECT COUNT(*) as total
+                    FROM alarm_history
+                    WHERE {where_sql}
+                """)
+
+                count_result = await self.session.execute(count_q, query_params)
+                total = count_result.scalar() or 0
 
             # Calculate pagination
-            offset = (page - 1) * page_size
             total_pages = (total + page_size - 1) // page_size if total > 0 else 1
 
+            # Keyset when the previous page's cursor is known, OFFSET otherwise
+            if after:
+                page_sql = f"{where_sql} AND (triggered_at, event_id) < (:cursor_ts, :cursor_id)"
+                limit_sql = "LIMIT :limit"
+                query_params["cursor_ts"] = after["triggered_at"]
+                query_params["cursor_id"] = after["event_id"]
+            else:
+                page_sql = where_sql
+                limit_sql = "LIMIT :limit OFFSET :offset"
+                query_params["offset"] = (page - 1) * page_size
+
             # Fetch paginated data
             q = text(f"""
                 SELECT
@@ -133,13 +153,12 @@ class AlarmService:
                     resolved,
                     resolved_at
                 FROM alarm_history
-                WHERE {where_sql}
-                ORDER BY triggered_at DESC
-                LIMIT :limit OFFSET :offset
+                WHERE {page_sql}
+                ORDER BY triggered_at DESC, event_id DESC
+                {limit_sql}
             """)
 
             query_params["limit"] = page_size
-            query_params["offset"] = offset
 
             result = await self.session.execute(q, query_params)
             rows = result.mappings().all()
@@ -191,6 +210,12 @@ class AlarmService:
 
             console.info(f"Loaded {len(alarms)} / {total} RULE_BASE alarms (page {page}/{total_pages})")
 
+            # Cursor for the next page (raw values, not the formatted KST strings)
+            next_cursor = None
+            if len(rows) == page_size:
+                last = rows[-1]
+                next_cursor = {"triggered_at": last["triggered_at"], "event_id": last["event_id"]}
+
             # Return paginated result
             return {
                 "alarms": alarms,
@@ -198,16 +223,19 @@ class AlarmService:
                 "page": page,
                 "page_size": page_size,
                 "total_pages": total_pages,
+                "next_cursor": next_cursor,
             }
 
         except Exception as e:
             console.error(f"Failed to load rule-based alarms: {e}")
             return {
+                "error": str(e),
                 "alarms": [],
                 "total": 0,
                 "page": 1,
                 "page_size": page_size,
                 "total_pages": 1,
+                "next_cursor": None,
             }
 
     async def get_active_sensor_alarms(
@@ -347,6 +375,7 @@ class AlarmService:
         except Exception as e:
             console.error(f"Failed to load sensor-level alarms: {e}")
             return {
+                "error": str(e),
                 "alarms": [],
                 "total": 0,
                 "page": 1,
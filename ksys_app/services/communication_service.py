@@ -5,31 +5,160 @@ Communication Service
 - FIXED: influx_agg_1m 기반으로 변경 (2025-11-26)
   - 예측 가능한 주기: 1분당 1레코드 = 시간당 60레코드
   - quality=0 집계만 포함 (avg_value)
+- 기간 필터는 bucket(timestamptz)을 그대로 비교 (인덱스 사용 가능)
+  - KST 변환은 date_trunc/표시용 컬럼에서만 수행
+- 쿼리는 asyncpg 글로벌 풀(ksys_app.db)로 직접 실행
+  - SQL은 모듈 상수 ($1, $2 위치 파라미터) → 연결별 prepared statement 캐시 재사용
+- success_rate: CASE로 100% 상한 처리, 비율 계산은 double precision (NUMERIC 연산 최소화)
 """
+import time
 from typing import List, Dict
-from datetime import datetime, timedelta
-from sqlalchemy import text
-from ksys_app.services.base_service import BaseService
+from reflex.utils import console
+from ksys_app.db import q, q_one
+
+# Returned by get_tag_summary when the query fails
+_EMPTY_SUMMARY = {
+    "total_records": 0,
+    "expected_records": 0,
+    "active_hours": 0,
+    "success_rate": 0.0
+}
+
+# Tag list changes on the order of hours - keep it in-process for TAGS_CACHE_TTL seconds
+TAGS_CACHE_TTL = 60.0
+_TAGS_CACHE: tuple[float, List[str]] | None = None  # (loaded_at monotonic, tags)
+
+_AVAILABLE_TAGS_SQL = """
+    SELECT DISTINCT tag_name
+    FROM influx_latest
+    ORDER BY tag_name
+"""
+
+# $1 = days, $2 = tag
+_HOURLY_STATS_SQL = """
+    WITH hourly_data AS (
+        SELECT
+            (date_trunc('hour', bucket AT TIME ZONE 'Asia/Seoul'))::timestamp as timestamp_kst,
+            COUNT(*) as record_count,
+            60 as expected_count  -- 1 record per minute = 60 per hour
+        FROM influx_agg_1m
+        WHERE bucket >= NOW() - $1::int * INTERVAL '1 day'
+          AND bucket < NOW()
+          AND tag_name = $2
+        GROUP BY date_trunc('hour', bucket AT TIME ZONE 'Asia/Seoul')
+    )
+    SELECT
+        timestamp_kst as timestamp,
+        record_count,
+        expected_count,
+        CASE
+            WHEN record_count >= expected_count THEN 100.0::float
+            ELSE ROUND((record_count::float * 100 / expected_count)::numeric, 2)::float
+        END as success_rate,
+        TO_CHAR(timestamp_kst, 'YYYY-MM-DD') as date,
+        EXTRACT(hour FROM timestamp_kst) as hour
+    FROM hourly_data
+    ORDER BY timestamp_kst DESC
+"""
 
+# $1 = days
+_DAILY_STATS_SQL = """
+    WITH daily_data AS (
+        SELECT
+            (date_trunc('day', bucket AT TIME ZONE 'Asia/Seoul'))::date as date_kst,
+            tag_name,
+            COUNT(*) as daily_count,
+            1440 as expected_daily_count  -- 60 * 24 = 1440 per day
+        FROM influx_agg_1m
+        WHERE bucket >= NOW() - $1::int * INTERVAL '1 day'
+          AND bucket < NOW()
+        GROUP BY date_trunc('day', bucket AT TIME ZONE 'Asia/Seoul'), tag_name
+    )
+    SELECT
+        date_kst::text as date,
+        tag_name,
+        daily_count::int as daily_count,
+        expected_daily_count::int as expected_daily_count,
+        CASE
+            WHEN daily_count >= expected_daily_count THEN 100.0::float
+            ELSE ROUND((daily_count::float * 100 / expected_daily_count)::numeric, 2)::float
+        END as success_rate
+    FROM daily_data
+    WHERE daily_count > 0
+    ORDER BY date_kst DESC, tag_name
+"""
+
+# $1 = days, $2 = tag
+_TAG_SUMMARY_SQL = """
+    WITH hourly AS (
+        -- One row per active hour: a streaming GROUP BY instead of COUNT(DISTINCT ...)
+        SELECT
+            date_trunc('hour', bucket AT TIME ZONE 'Asia/Seoul') as hour_kst,
+            COUNT(*) as record_count
+        FROM influx_agg_1m
+        WHERE bucket >= NOW() - $1::int * INTERVAL '1 day'
+          AND bucket < NOW()
+          AND tag_name = $2
+        GROUP BY 1
+    ),
+    stats AS (
+        SELECT
+            COALESCE(SUM(record_count), 0)::bigint as total_records,
+            COUNT(*) as active_hours,
+            $1::int * 1440 as expected_records  -- days * 60 * 24
+        FROM hourly
+    )
+    SELECT
+        total_records,
+        GREATEST(expected_records, 1) as expected_records,
+        active_hours,
+        CASE
+            WHEN expected_records <= 0 THEN NULL
+            WHEN total_records >= expected_records THEN 100.0::float
+            ELSE ROUND((total_records::float * 100 / expected_records)::numeric, 2)::float
+        END as success_rate
+    FROM stats
+"""
 
-class CommunicationService(BaseService):
-    """Service for communication success rate monitoring"""
+
+class CommunicationService:
+    """Service for communication success rate monitoring (asyncpg pool, no ORM session)"""
 
     async def get_available_tags(self) -> List[str]:
         """
-        Get list of available sensor tags
+        Get list of available sensor tags (cached for TAGS_CACHE_TTL seconds)
 
         Returns:
             List of tag names
         """
-        query = text("""
-            SELECT DISTINCT tag_name
-            FROM influx_latest
-            ORDER BY tag_name
-        """)
+        global _TAGS_CACHE
+
+        cached = _TAGS_CACHE
+        if cached is not None and time.monotonic() - cached[0] < TAGS_CACHE_TTL:
+            return list(cached[1])
+
+        try:
+            rows = await q(_AVAILABLE_TAGS_SQL, (), timeout=5.0, as_dict=False)
+            tags = [row['tag_name'] for row in rows]
 
-        rows = await self.execute_query(query, timeout="5s")
-        return [row['tag_name'] for row in rows]
+        except Exception as e:
+            console.error(f"Failed to load available tags: {e}")
+            return []
+
+        _TAGS_CACHE = (time.monotonic(), tags)
+        return list(tags)
+
+    async def refresh_tags(self) -> List[str]:
+        """
+        Drop the cached tag list and reload it from the database
+
+        Returns:
+            List of tag names
+        """
+        global _TAGS_CACHE
+
+        _TAGS_CACHE = None
+        return await self.get_available_tags()
 
     async def get_hourly_stats(self, tag: str, days: int) -> List[Dict]:
         """
@@ -52,37 +181,12 @@ class CommunicationService(BaseService):
             - date: Date string (KST)
             - hour: Hour of day (KST)
         """
-        query = text("""
-            WITH hourly_data AS (
-                SELECT
-                    (date_trunc('hour', bucket AT TIME ZONE 'Asia/Seoul'))::timestamp as timestamp_kst,
-                    COUNT(*) as record_count,
-                    60 as expected_count  -- 1 record per minute = 60 per hour
-                FROM influx_agg_1m
-                WHERE (bucket AT TIME ZONE 'Asia/Seoul') >= (NOW() AT TIME ZONE 'Asia/Seoul') - :days * INTERVAL '1 day'
-                  AND (bucket AT TIME ZONE 'Asia/Seoul') < (NOW() AT TIME ZONE 'Asia/Seoul')
-                  AND tag_name = :tag
-                GROUP BY date_trunc('hour', bucket AT TIME ZONE 'Asia/Seoul')
-            )
-            SELECT
-                timestamp_kst as timestamp,
-                record_count,
-                expected_count,
-                LEAST(
-                    ROUND((record_count::NUMERIC / expected_count) * 100, 2),
-                    100.0
-                ) as success_rate,
-                TO_CHAR(timestamp_kst, 'YYYY-MM-DD') as date,
-                EXTRACT(hour FROM timestamp_kst) as hour
-            FROM hourly_data
-            ORDER BY timestamp_kst DESC
-        """)
-
-        return await self.execute_query(
-            query,
-            {"days": days, "tag": tag},
-            timeout="15s"
-        )
+        try:
+            return await q(_HOURLY_STATS_SQL, (int(days), tag), timeout=15.0)
+
+        except Exception as e:
+            console.error(f"Failed to load hourly stats for {tag}: {e}")
+            return []
 
     async def get_daily_stats(self, days: int) -> List[Dict]:
         """
@@ -103,48 +207,14 @@ class CommunicationService(BaseService):
             - expected_daily_count: Expected 1440 records
             - success_rate: Percentage (capped at 100%)
         """
-        query = text("""
-            WITH daily_data AS (
-                SELECT
-                    (date_trunc('day', bucket AT TIME ZONE 'Asia/Seoul'))::date as date_kst,
-                    tag_name,
-                    COUNT(*) as daily_count,
-                    1440 as expected_daily_count  -- 60 * 24 = 1440 per day
-                FROM influx_agg_1m
-                WHERE (bucket AT TIME ZONE 'Asia/Seoul') >= (NOW() AT TIME ZONE 'Asia/Seoul') - :days * INTERVAL '1 day'
-                  AND (bucket AT TIME ZONE 'Asia/Seoul') < (NOW() AT TIME ZONE 'Asia/Seoul')
-                GROUP BY date_trunc('day', bucket AT TIME ZONE 'Asia/Seoul'), tag_name
-            )
-            SELECT
-                date_kst::text as date,
-                tag_name,
-                daily_count,
-                expected_daily_count,
-                LEAST(
-                    ROUND((daily_count::NUMERIC / expected_daily_count) * 100, 2),
-                    100.0
-                )::float as success_rate
-            FROM daily_data
-            WHERE daily_count > 0
-            ORDER BY date_kst DESC, tag_name
-        """)
-
-        rows = await self.execute_query(
-            query,
-            {"days": days},
-            timeout="15s"
-        )
-
-        return [
-            {
-                "date": row["date"],
-                "tag_name": row["tag_name"],
-                "daily_count": int(row["daily_count"]),
-                "expected_daily_count": int(row["expected_daily_count"]),
-                "success_rate": float(row["success_rate"])
-            }
-            for row in rows
-        ]
+        try:
+            # Small result (days x tags) that ends up in state anyway - a plain fetch,
+            # no server-side cursor. SQL already returns int/float columns
+            return await q(_DAILY_STATS_SQL, (int(days),), timeout=15.0)
+
+        except Exception as e:
+            console.error(f"Failed to load daily stats: {e}")
+            return []
 
     async def get_tag_summary(self, tag: str, days: int) -> Dict:
         """
@@ -163,43 +233,11 @@ class CommunicationService(BaseService):
         """
         days_int = int(days) if not isinstance(days, int) else days
 
-        query = text("""
-            WITH stats AS (
-                SELECT
-                    COUNT(*) as total_records,
-                    COUNT(DISTINCT date_trunc('hour', bucket AT TIME ZONE 'Asia/Seoul')) as active_hours,
-                    :days * 1440 as expected_records  -- days * 60 * 24
-                FROM influx_agg_1m
-                WHERE (bucket AT TIME ZONE 'Asia/Seoul') >= (NOW() AT TIME ZONE 'Asia/Seoul') - :days * INTERVAL '1 day'
-                  AND (bucket AT TIME ZONE 'Asia/Seoul') < (NOW() AT TIME ZONE 'Asia/Seoul')
-                  AND tag_name = :tag
-            )
-            SELECT
-                total_records,
-                GREATEST(expected_records, 1) as expected_records,
-                active_hours,
-                LEAST(
-                    ROUND((total_records::NUMERIC / NULLIF(expected_records, 0)) * 100, 2),
-                    100.0
-                ) as success_rate
-            FROM stats
-        """)
-
-        rows = await self.execute_query(
-            query,
-            {
-                "tag": tag,
-                "days": days_int
-            },
-            timeout="10s"
-        )
-
-        if rows:
-            return rows[0]
-        else:
-            return {
-                "total_records": 0,
-                "expected_records": 0,
-                "active_hours": 0,
-                "success_rate": 0.0
-            }
+        try:
+            summary = await q_one(_TAG_SUMMARY_SQL, (days_int, tag), timeout=10.0)
+
+        except Exception as e:
+            console.error(f"Failed to load summary for {tag}: {e}")
+            summary = None
+
+        return summary if summary is not None else dict(_EMPTY_SUMMARY)
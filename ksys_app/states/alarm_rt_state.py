@@ -84,7 +84,7 @@ class AlarmRTState(rx.State):
                 ORDER BY l.tag_name
             """
 
-            rows = await q(query, ())
+            rows = await q(query, (), as_dict=False)
 
             all_sensors = []
             normal_count = 0
@@ -10,6 +10,15 @@ from reflex.utils import console
 
 from ksys_app.db_orm import get_async_session
 from ksys_app.services.alarm_service import AlarmService
+from ksys_app.utils import page_cache
+
+# Seconds a fetched alarm page stays reusable for back/forward navigation
+PAGE_CACHE_TTL = 5.0
+
+
+def _is_cacheable_page(result: Any) -> bool:
+    """AlarmService returns an empty page with an "error" key on failure - never cache it"""
+    return isinstance(result, dict) and not result.get("error")
 
 
 class AlarmsState(rx.State):
@@ -49,6 +58,11 @@ class AlarmsState(rx.State):
     page_size: int = 20
     total_count: int = 0
 
+    # Keyset pagination (history view): page -> cursor of that page's last row
+    # Cleared whenever the filters that define the result set change
+    _page_cursors: Dict[int, Dict[str, Any]] = {}
+    _cursor_filter_key: str = ""
+
     # Selection
     selected_alarms: List[str] = []  # List of event_ids
 
@@ -153,15 +167,15 @@ class AlarmsState(rx.State):
         # Search is now handled server-side, so total_count already reflects filters
         return self.total_count if self.total_count > 0 else len(self.alarms)
 
-    # Direct state variable instead of computed var to force UI updates
-    _page_info_cache: str = "0 / 0"
-
     @rx.var
-    def page_info(self) -> str:
-        """페이지 정보 문자열 (예: "1-20 / 144")"""
-        # Use cached value that's explicitly set after data fetch
-        # This ensures UI gets updated when search filters change
-        return self._page_info_cache
+    def page_display(self) -> str:
+        """페이지네이션 표시 문자열 (예: "Showing 1-20 of 144")"""
+        total = self.filtered_count
+        if total == 0:
+            return "Showing 0 of 0"
+        start = (self.page - 1) * self.page_size + 1
+        end = min(self.page * self.page_size, total)
+        return f"Showing {start}-{end} of {total}"
 
     @rx.var
     def has_prev_page(self) -> bool:
@@ -214,6 +228,7 @@ class AlarmsState(rx.State):
 
         async with self:
             self.loading = True
+        page_cache.bump()  # Fresh data on mount
         yield  # Update UI with loading state
 
         try:
@@ -235,37 +250,62 @@ class AlarmsState(rx.State):
                 self.loading = False
             yield  # Final UI update
 
-    async def _fetch_data(self):
-        """Internal data fetch without yield (for initialize)"""
+    async def _fetch_data(self, reuse_total: bool = False):
+        """Internal data fetch without yield (for initialize)
+
+        Args:
+            reuse_total: Keep the current total_count instead of re-running
+                COUNT(*) (page navigation with unchanged filters)
+        """
         selected_hours = self.selected_hours
 
+        # Keyset cursor from the previous page (only valid for the same filters)
+        filter_key = f"{self.view_mode}|{selected_hours}|{self.search_query}"
+        cursor_valid = filter_key == self._cursor_filter_key
+        after = self._page_cursors.get(self.page - 1) if cursor_valid and self.page > 1 else None
+        known_total = self.total_count if reuse_total and after else None
+
         console.info(f"Fetching alarms for last {selected_hours} hours (view_mode: {self.view_mode})")
 
         try:
             async with get_async_session() as session:
                 service = AlarmService(session)
 
-                # Fetch alarms based on view_mode
-                if self.view_mode == "active":
-                    # Active view: Sensor-level status (DISTINCT ON tag_name)
-                    result = await service.get_active_sensor_alarms(
-                        hours=selected_hours,
-                        page=self.page,
-                        page_size=self.page_size
-                    )
-                    console.info(f"📊 Active view: Loaded {result.get('total', 0)} sensors")
-                else:
-                    # History view: All alarms chronologically
-                    result = await service.get_rule_based_alarms(
-                        hours=selected_hours,
-                        page=self.page,
-                        page_size=self.page_size,
-                        search_query=self.search_query if self.search_query else None
-                    )
-                    console.info(f"📜 History view: Loaded {result.get('total', 0)} alarms (search: {self.search_query or 'none'})")
-
-                # Get statistics (same for both views)
-                stats = await service.get_alarm_statistics(hours=selected_hours)
+                async def load_page():
+                    # Fetch alarms based on view_mode
+                    if self.view_mode == "active":
+                        # Active view: Sensor-level status (DISTINCT ON tag_name)
+                        page_result = await service.get_active_sensor_alarms(
+                            hours=selected_hours,
+                            page=self.page,
+                            page_size=self.page_size
+                        )
+                        console.info(f"📊 Active view: Loaded {page_result.get('total', 0)} sensors")
+                    else:
+                        # History view: All alarms chronologically
+                        page_result = await service.get_rule_based_alarms(
+                            hours=selected_hours,
+                            page=self.page,
+                            page_size=self.page_size,
+                            search_query=self.search_query if self.search_query else None,
+                            after=after,
+                            total=known_total,
+                        )
+                        console.info(f"📜 History view: Loaded {page_result.get('total', 0)} alarms (search: {self.search_query or 'none'})")
+                    return page_result
+
+                # Paging back and forth within PAGE_CACHE_TTL reuses the same result
+                # (shared across sessions; refresh/acknowledge call page_cache.bump())
+                cache_key = ("alarms", filter_key, self.page, self.page_size)
+                result = await page_cache.get_or_fetch(
+                    cache_key,
+                    PAGE_CACHE_TTL,
+                    load_page,
+                    cache_if=_is_cacheable_page,
+                )
+
+                # Statistics don't depend on the page - skip them while just paging
+                stats = None if reuse_total else await service.get_alarm_statistics(hours=selected_hours)
 
             # Extract alarms list and total count from result
             if isinstance(result, dict) and 'alarms' in result:
@@ -279,34 +319,35 @@ class AlarmsState(rx.State):
                 self.alarms = alarms
                 self.total_count = total_count  # Store total for server-side pagination
 
-                # Explicitly calculate and cache page_info to force UI update
-                if total_count == 0:
-                    self._page_info_cache = "0 / 0"
-                else:
-                    start = (self.page - 1) * self.page_size + 1
-                    end = min(self.page * self.page_size, total_count)
-                    self._page_info_cache = f"{start}-{end} / {total_count}"
-
-                # Update individual stat fields
-                # ISA-18.2: Merge Level 4 (ERROR) + Level 5 (CRITICAL) as "위험 알람"
-                self.stat_total = stats.get("total", 0)
-                self.stat_critical = stats.get("critical", 0) + stats.get("error", 0)  # L5 + L4
-                self.stat_warning = stats.get("warning", 0)  # L3
-                self.stat_info = stats.get("info", 0) + stats.get("caution", 0)  # L2 + L1
-                self.stat_unacknowledged = stats.get("unacknowledged", 0)
-
-                # ISA-18.2 priorities
-                self.stat_priority_1_low = stats.get("priority_1_low", 0)
-                self.stat_priority_2_medium = stats.get("priority_2_medium", 0)
-                self.stat_priority_3_high = stats.get("priority_3_high", 0)
-                self.stat_priority_4_critical = stats.get("priority_4_critical", 0)
+                # Remember where this page ended so the next page can use keyset
+                if not cursor_valid:
+                    self._page_cursors = {}
+                    self._cursor_filter_key = filter_key
+                next_cursor = result.get("next_cursor") if isinstance(result, dict) else None
+                if next_cursor:
+                    self._page_cursors[self.page] = next_cursor
+
+                if stats is not None:
+                    # Update individual stat fields
+                    # ISA-18.2: Merge Level 4 (ERROR) + Level 5 (CRITICAL) as "위험 알람"
+                    self.stat_total = stats.get("total", 0)
+                    self.stat_critical = stats.get("critical", 0) + stats.get("error", 0)  # L5 + L4
+                    self.stat_warning = stats.get("warning", 0)  # L3
+                    self.stat_info = stats.get("info", 0) + stats.get("caution", 0)  # L2 + L1
+                    self.stat_unacknowledged = stats.get("unacknowledged", 0)
+
+                    # ISA-18.2 priorities
+                    self.stat_priority_1_low = stats.get("priority_1_low", 0)
+                    self.stat_priority_2_medium = stats.get("priority_2_medium", 0)
+                    self.stat_priority_3_high = stats.get("priority_3_high", 0)
+                    self.stat_priority_4_critical = stats.get("priority_4_critical", 0)
                 self.last_update = "Just now"
                 self.loading = False
 
                 # Log inside async with self to ensure values are correct
-                console.info(f"Loaded {len(self.alarms)} alarms, {self.stat_critical} critical (L5={stats.get('critical', 0)} + L4={stats.get('error', 0)})")
+                console.info(f"Loaded {len(self.alarms)} alarms, {self.stat_critical} critical")
                 console.info(f"⚡ Stats fields updated: total={self.stat_total}, critical={self.stat_critical}, warning={self.stat_warning}, unacked={self.stat_unacknowledged}")
-                console.info(f"🔍 DEBUG total_count={self.total_count}, filtered_count={self.filtered_count}, page_info={self._page_info_cache}")
+                console.info(f"🔍 DEBUG total_count={self.total_count}, filtered_count={self.filtered_count}, page_display={self.page_display}")
 
         except Exception as e:
             console.error(f"Fetch data failed: {e}")
@@ -344,7 +385,7 @@ class AlarmsState(rx.State):
                 ORDER BY l.tag_name
             """
 
-            rows = await q(query, ())
+            rows = await q(query, (), as_dict=False)
 
             all_sensors = []
             normal_count = 0
@@ -399,6 +440,7 @@ class AlarmsState(rx.State):
 
         async with self:
             self.loading = True
+        page_cache.bump()  # Bypass cached pages
         yield
 
         try:
@@ -505,7 +547,7 @@ class AlarmsState(rx.State):
                 self.loading = True
                 yield  # Update UI with loading state
 
-            await self._fetch_data()  # Fetch new page data
+            await self._fetch_data(reuse_total=True)  # Fetch new page data
 
             async with self:
                 self.loading = False
@@ -520,7 +562,7 @@ class AlarmsState(rx.State):
                 self.loading = True
                 yield  # Update UI with loading state
 
-            await self._fetch_data()  # Fetch new page data
+            await self._fetch_data(reuse_total=True)  # Fetch new page data
 
             async with self:
                 self.loading = False
@@ -565,8 +607,9 @@ class AlarmsState(rx.State):
                 for event_id in self.selected_alarms:
                     await service.acknowledge_alarm(event_id, "user")
 
-            # Refresh data
-            await self.refresh_data()
+            # Refresh data (refresh_data is an event handler - fetch directly)
+            page_cache.bump()  # Cached pages still show them unacknowledged
+            await self._fetch_data()
 
             # Clear selection
             async with self:
@@ -590,6 +633,7 @@ class AlarmsState(rx.State):
 
             if success:
                 # Update local state
+                page_cache.bump()  # Cached pages still show it unacknowledged
                 async with self:
                     for alarm in self.alarms:
                         if alarm.get("event_id") == event_id:
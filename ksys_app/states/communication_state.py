@@ -12,7 +12,6 @@ import numpy as np
 from typing import Dict, List, Any
 from datetime import datetime
 
-from ksys_app.db_orm import get_async_session
 from ksys_app.services.communication_service import CommunicationService
 from reflex.utils import console
 
@@ -363,9 +362,8 @@ class CommunicationState(rx.State):
 
         try:
             # Fetch available tags
-            async with get_async_session() as session:
-                service = CommunicationService(session)
-                tags = await service.get_available_tags()
+            service = CommunicationService()
+            tags = await service.get_available_tags()
 
             async with self:
                 self.available_tags = tags
@@ -397,29 +395,25 @@ class CommunicationState(rx.State):
         console.info(f"[TIMING] Starting data fetch for tag={selected_tag}, days={selected_days}")
 
         try:
-            t_session_start = time.time()
-            async with get_async_session() as session:
-                console.info(f"[TIMING] Session created: {time.time() - t_session_start:.3f}s")
-
-                service = CommunicationService(session)
-
-                # Fetch hourly data
-                t1 = time.time()
-                hourly = await service.get_hourly_stats(selected_tag, selected_days)
-                hourly_time = time.time() - t1
-                console.info(f"[TIMING] Hourly stats ({len(hourly)} records): {hourly_time:.3f}s")
-
-                # Fetch daily data
-                t2 = time.time()
-                daily = await service.get_daily_stats(selected_days)
-                daily_time = time.time() - t2
-                console.info(f"[TIMING] Daily stats ({len(daily)} records): {daily_time:.3f}s")
-
-                # Fetch summary
-                t3 = time.time()
-                summary = await service.get_tag_summary(selected_tag, selected_days)
-                summary_time = time.time() - t3
-                console.info(f"[TIMING] Summary stats: {summary_time:.3f}s")
+            service = CommunicationService()
+
+            # Fetch hourly data
+            t1 = time.time()
+            hourly = await service.get_hourly_stats(selected_tag, selected_days)
+            hourly_time = time.time() - t1
+            console.info(f"[TIMING] Hourly stats ({len(hourly)} records): {hourly_time:.3f}s")
+
+            # Fetch daily data
+            t2 = time.time()
+            daily = await service.get_daily_stats(selected_days)
+            daily_time = time.time() - t2
+            console.info(f"[TIMING] Daily stats ({len(daily)} records): {daily_time:.3f}s")
+
+            # Fetch summary
+            t3 = time.time()
+            summary = await service.get_tag_summary(selected_tag, selected_days)
+            summary_time = time.time() - t3
+            console.info(f"[TIMING] Summary stats: {summary_time:.3f}s")
 
             # Update state
             t_state_update = time.time()
@@ -452,13 +446,12 @@ class CommunicationState(rx.State):
             self.loading = True
 
         try:
-            async with get_async_session() as session:
-                service = CommunicationService(session)
+            service = CommunicationService()
 
-                # Fetch all data in parallel would be ideal, but sequential is safer
-                hourly = await service.get_hourly_stats(selected_tag, selected_days)
-                daily = await service.get_daily_stats(selected_days)
-                summary = await service.get_tag_summary(selected_tag, selected_days)
+            # Fetch all data in parallel would be ideal, but sequential is safer
+            hourly = await service.get_hourly_stats(selected_tag, selected_days)
+            daily = await service.get_daily_stats(selected_days)
+            summary = await service.get_tag_summary(selected_tag, selected_days)
 
             async with self:
                 self._df_hourly = hourly
@@ -0,0 +1,92 @@
+"""
+CommunicationService 태그 목록 캐시 테스트
+- TAGS_CACHE_TTL 내 재사용 / 만료 / 실패 미캐시 / refresh_tags() 강제 재조회 / 반환값 복사
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from ksys_app.services import communication_service
+from ksys_app.services.communication_service import CommunicationService, TAGS_CACHE_TTL
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """communication_service.time.monotonic만 교체 (이벤트 루프 시계는 그대로)"""
+    now = {"t": 1000.0}
+    monkeypatch.setattr(communication_service, "time", SimpleNamespace(monotonic=lambda: now["t"]))
+    return now
+
+
+@pytest.fixture
+def tag_query(monkeypatch):
+    monkeypatch.setattr(communication_service, "_TAGS_CACHE", None)
+    state = {"calls": 0, "error": None, "tags": ["FLOW", "INLET_PRESSURE"]}
+
+    async def fake_q(sql, params=(), timeout=30.0, as_dict=True):
+        state["calls"] += 1
+        if state["error"]:
+            raise state["error"]
+        return [{"tag_name": tag} for tag in state["tags"]]
+
+    monkeypatch.setattr(communication_service, "q", fake_q)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_tags_reused_within_ttl(clock, tag_query):
+    service = CommunicationService()
+
+    first = await service.get_available_tags()
+    clock["t"] += TAGS_CACHE_TTL - 1
+    second = await service.get_available_tags()
+
+    assert first == second == ["FLOW", "INLET_PRESSURE"]
+    assert tag_query["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tags_reloaded_after_ttl(clock, tag_query):
+    service = CommunicationService()
+
+    await service.get_available_tags()
+    tag_query["tags"] = ["FLOW"]
+    clock["t"] += TAGS_CACHE_TTL + 1
+
+    assert await service.get_available_tags() == ["FLOW"]
+    assert tag_query["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_not_cached(clock, tag_query):
+    service = CommunicationService()
+    tag_query["error"] = RuntimeError("db down")
+
+    assert await service.get_available_tags() == []
+
+    tag_query["error"] = None
+    assert await service.get_available_tags() == ["FLOW", "INLET_PRESSURE"]
+    assert tag_query["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_tags_forces_reload(clock, tag_query):
+    service = CommunicationService()
+
+    await service.get_available_tags()
+    tag_query["tags"] = ["FLOW"]
+
+    assert await service.refresh_tags() == ["FLOW"]
+    assert tag_query["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_mutating_returned_tags_does_not_change_cache(clock, tag_query):
+    service = CommunicationService()
+
+    tags = await service.get_available_tags()
+    tags.append("BOGUS")
+    tags.remove("FLOW")
+
+    assert await service.get_available_tags() == ["FLOW", "INLET_PRESSURE"]
+    assert tag_query["calls"] == 1
@@ -0,0 +1,108 @@
+"""
+글로벌 풀 연결 획득 (ksys_app.db.acquire) 테스트
+- 풀 포화 시 PoolTimeoutError (asyncio.TimeoutError 하위 클래스)
+- 직접 연결(asyncpg.connect) fallback 없음
+- 예외 발생 시에도 연결 반환
+"""
+import asyncio
+
+import pytest
+
+from ksys_app import db
+
+
+class _FakeConn:
+    def __init__(self, error=None):
+        self.error = error
+
+    async def fetch(self, sql, *args, timeout=None):
+        if self.error:
+            raise self.error
+        return [{"v": 1}]
+
+    async def execute(self, sql, *args, timeout=None):
+        if self.error:
+            raise self.error
+        return "OK"
+
+
+class _FakePool:
+    def __init__(self, conn=None, exhausted=False):
+        self.conn = conn or _FakeConn()
+        self.exhausted = exhausted
+        self.acquire_timeouts = []
+        self.released = []
+
+    async def acquire(self, timeout=None):
+        self.acquire_timeouts.append(timeout)
+        if self.exhausted:
+            raise asyncio.TimeoutError()
+        return self.conn
+
+    async def release(self, conn):
+        self.released.append(conn)
+
+
+@pytest.fixture
+def connect_calls(monkeypatch):
+    calls = []
+
+    async def fake_connect(*args, **kwargs):
+        calls.append((args, kwargs))
+        raise AssertionError("asyncpg.connect must not be called")
+
+    monkeypatch.setattr(db.asyncpg, "connect", fake_connect)
+    return calls
+
+
+@pytest.fixture
+def use_pool(monkeypatch):
+    def _install(pool):
+        monkeypatch.setattr(db, "_GLOBAL_POOL", pool)
+        return pool
+
+    return _install
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("call", [
+    lambda: db.q("SELECT 1"),
+    lambda: db.execute_query("SELECT 1"),
+])
+async def test_exhausted_pool_raises_pool_timeout(use_pool, connect_calls, call):
+    pool = use_pool(_FakePool(exhausted=True))
+
+    with pytest.raises(db.PoolTimeoutError):
+        await call()
+
+    assert pool.acquire_timeouts == [db.POOL_ACQUIRE_TIMEOUT]
+    assert connect_calls == []
+
+
+@pytest.mark.asyncio
+async def test_pool_timeout_is_asyncio_timeout(use_pool, connect_calls):
+    use_pool(_FakePool(exhausted=True))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await db.q("SELECT 1")
+
+
+@pytest.mark.asyncio
+async def test_connection_released_when_body_raises(use_pool):
+    pool = use_pool(_FakePool())
+
+    with pytest.raises(RuntimeError):
+        async with db.acquire() as conn:
+            raise RuntimeError("boom")
+
+    assert pool.released == [conn]
+
+
+@pytest.mark.asyncio
+async def test_connection_released_when_query_fails(use_pool):
+    pool = use_pool(_FakePool(conn=_FakeConn(error=ValueError("bad sql"))))
+
+    with pytest.raises(ValueError):
+        await db.q("SELECT 1")
+
+    assert pool.released == [pool.conn]
@@ -0,0 +1,203 @@
+"""
+페이지 캐시 (ksys_app.utils.page_cache) 테스트
+- get_or_fetch / TTL 만료 / bump() 무효화 / 실패 결과 미캐시 / 반환값 복사
+- AlarmsState._fetch_data 캐시 키 (세션 간 공유, refresh 후 재조회)
+"""
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from ksys_app.utils import page_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    page_cache.clear()
+    yield
+    page_cache.clear()
+
+
+def _counting_loader(value):
+    calls = {"n": 0}
+
+    async def loader():
+        calls["n"] += 1
+        return value
+
+    return loader, calls
+
+
+@pytest.mark.asyncio
+async def test_second_call_hits_cache():
+    loader, calls = _counting_loader(["row"])
+
+    first = await page_cache.get_or_fetch(("alarms", 1, 20), 5.0, loader)
+    second = await page_cache.get_or_fetch(("alarms", 1, 20), 5.0, loader)
+
+    assert first == second == ["row"]
+    assert calls["n"] == 1
+
+
+@pytest.mark.asyncio
+async def test_different_key_reloads():
+    loader, calls = _counting_loader(["row"])
+
+    await page_cache.get_or_fetch(("alarms", 1, 20), 5.0, loader)
+    await page_cache.get_or_fetch(("alarms", 2, 20), 5.0, loader)
+
+    assert calls["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_entry_expires_after_ttl():
+    loader, calls = _counting_loader(["row"])
+
+    await page_cache.get_or_fetch("k", 0.05, loader)
+    await asyncio.sleep(0.1)
+    await page_cache.get_or_fetch("k", 0.05, loader)
+
+    assert calls["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_bump_invalidates_existing_entries():
+    loader, calls = _counting_loader(["row"])
+
+    await page_cache.get_or_fetch("k", 5.0, loader)
+    page_cache.bump()
+    await page_cache.get_or_fetch("k", 5.0, loader)
+
+    assert calls["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_bump_during_load_is_not_served_afterwards():
+    calls = {"n": 0}
+
+    async def loader():
+        calls["n"] += 1
+        page_cache.bump()  # e.g. another session refreshes mid-query
+        return ["stale"]
+
+    await page_cache.get_or_fetch("k", 5.0, loader)
+    await page_cache.get_or_fetch("k", 5.0, loader)
+
+    assert calls["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_if_false_is_not_stored():
+    loader, calls = _counting_loader({"error": "boom", "alarms": []})
+
+    await page_cache.get_or_fetch("k", 5.0, loader, cache_if=lambda r: not r.get("error"))
+    await page_cache.get_or_fetch("k", 5.0, loader, cache_if=lambda r: not r.get("error"))
+
+    assert calls["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_mutating_returned_value_does_not_change_cache():
+    loader, calls = _counting_loader({"alarms": [{"event_id": "e1", "acknowledged": False}]})
+
+    first = await page_cache.get_or_fetch("k", 5.0, loader)
+    first["alarms"][0]["acknowledged"] = True  # what acknowledge_alarm does in place
+    second = await page_cache.get_or_fetch("k", 5.0, loader)
+    second["alarms"].append({"event_id": "e2"})
+    third = await page_cache.get_or_fetch("k", 5.0, loader)
+
+    assert calls["n"] == 1
+    assert third == {"alarms": [{"event_id": "e1", "acknowledged": False}]}
+
+
+# ---------------------------------------------------------------------------
+# AlarmsState._fetch_data
+# ---------------------------------------------------------------------------
+
+class _FakeState:
+    """Plain stand-in for AlarmsState: attributes + `async with self`"""
+
+    def __init__(self, **overrides):
+        self.selected_hours = 24
+        self.view_mode = "history"
+        self.search_query = ""
+        self.page = 1
+        self.page_size = 20
+        self.total_count = 0
+        self.filtered_count = 0
+        self.page_display = ""
+        self.alarms = []
+        self.stat_total = 0
+        self.stat_critical = 0
+        self.stat_warning = 0
+        self.stat_unacknowledged = 0
+        self.error_message = ""
+        self._page_cursors = {}
+        self._cursor_filter_key = ""
+        self.__dict__.update(overrides)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def alarms_module(monkeypatch):
+    alarms = pytest.importorskip("ksys_app.states.alarms")
+    calls = {"pages": 0}
+    results = []
+
+    class FakeAlarmService:
+        def __init__(self, session):
+            pass
+
+        async def get_rule_based_alarms(self, **kwargs):
+            calls["pages"] += 1
+            return results.pop(0) if results else {"alarms": [{"event_id": "e1"}], "total": 1}
+
+        async def get_active_sensor_alarms(self, **kwargs):
+            calls["pages"] += 1
+            return {"alarms": [], "total": 0}
+
+        async def get_alarm_statistics(self, **kwargs):
+            return {}
+
+    @asynccontextmanager
+    async def fake_session():
+        yield None
+
+    monkeypatch.setattr(alarms, "AlarmService", FakeAlarmService)
+    monkeypatch.setattr(alarms, "get_async_session", fake_session)
+    return alarms, calls, results
+
+
+@pytest.mark.asyncio
+async def test_fetch_data_shares_cache_until_bump(alarms_module):
+    alarms, calls, _ = alarms_module
+    fetch = alarms.AlarmsState._fetch_data
+
+    await fetch(_FakeState())
+    await fetch(_FakeState())  # second session, same filters -> cache hit
+    assert calls["pages"] == 1
+
+    page_cache.bump()  # what initialize/refresh/acknowledge do
+    state = _FakeState()
+    await fetch(state)
+    assert calls["pages"] == 2
+    assert state.alarms == [{"event_id": "e1"}]
+
+
+@pytest.mark.asyncio
+async def test_fetch_data_does_not_cache_error_page(alarms_module):
+    alarms, calls, results = alarms_module
+    fetch = alarms.AlarmsState._fetch_data
+    results.append({"error": "connection reset", "alarms": [], "total": 0})
+
+    await fetch(_FakeState())
+    state = _FakeState()
+    await fetch(state)
+
+    assert calls["pages"] == 2
+    assert state.total_count == 1
@@ -0,0 +1,78 @@
+"""
+Short-lived in-process cache for paginated query results
+
+- Keyed by (filters, page, page_size) tuples built by the caller
+- Avoids re-querying Postgres when a user pages back and forth
+- Shared by every session in the process: bump() invalidates all entries
+  (call it after refresh/acknowledge so no session sees stale pages)
+- Values are deep-copied on store and on hit: sessions never share mutable rows
+"""
+from __future__ import annotations
+
+import copy
+import itertools
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from cachetools import TTLCache
+
+DEFAULT_TTL = 5.0
+MAX_SIZE = 256
+
+# One TTLCache per TTL value (cachetools TTL is per-cache, not per-entry)
+_caches: dict[float, TTLCache] = {}
+
+# Process-wide invalidation version, prefixed to every key
+_versions = itertools.count(1)
+_version = next(_versions)
+
+
+def _cache_for(ttl: float) -> TTLCache:
+    cache = _caches.get(ttl)
+    if cache is None:
+        cache = _caches[ttl] = TTLCache(maxsize=MAX_SIZE, ttl=ttl)
+    return cache
+
+
+async def get_or_fetch(
+    key: Hashable,
+    ttl: float,
+    loader: Callable[[], Awaitable[Any]],
+    cache_if: Optional[Callable[[Any], bool]] = None,
+) -> Any:
+    """Return cached value for key, or await loader() and cache its result.
+
+    Args:
+        key: Hashable cache key (include everything that changes the result)
+        ttl: Seconds the value stays valid
+        loader: Zero-arg coroutine function producing the value on a miss
+        cache_if: Optional predicate; a loaded value is only stored when it
+            returns True (e.g. skip error results)
+
+    Returns:
+        Cached or freshly loaded value (a private copy - safe to mutate)
+    """
+    cache = _cache_for(ttl)
+    # Captured before loading: a bump() during the await leaves this entry unreachable
+    versioned_key = (_version, key)
+    try:
+        return copy.deepcopy(cache[versioned_key])
+    except KeyError:
+        pass
+
+    value = await loader()
+    if cache_if is None or cache_if(value):
+        cache[versioned_key] = copy.deepcopy(value)
+    return value
+
+
+def bump() -> None:
+    """Invalidate every cached page for all sessions."""
+    global _version
+    _version = next(_versions)
+    clear()
+
+
+def clear() -> None:
+    """Drop every cached page (all TTL buckets)."""
+    for cache in _caches.values():
+        cache.clear()